@@ -14,7 +14,8 @@ Key Features:
 - Security-hardened file operations
 
 Usage:
-1. Run the script and follow interactive prompts
+1. Run the script and follow interactive prompts, or pass settings as
+   command-line flags and/or a JSON/YAML file via --config
 2. Generated project structure includes:
    - SQL schema files
    - Docker configurations
@@ -31,23 +32,45 @@ Security Measures:
 """
 
 import os
+import argparse
 import csv
+import functools
+import json
 import re
+import stat
+import string
 import sys
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional, Set
 
 
 # Security Constants
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB maximum file size limit
+CSV_READ_BUFFER = 1 << 20  # 1MB read buffer for CSV inputs
 # Allowed characters for names
 # SAFE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
 SAFE_NAME_PATTERN = re.compile(r'^[\w/.-]+$')  # Allows word chars + / . -
+SAFE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + '_/.-')  # ASCII subset
+IDENTIFIER_STRIP_CHARS = '"`[] \t\n\r'  # Surrounding quotes/brackets and whitespace
 ALLOWED_DB_TYPES = {'mysql', 'postgresql', 'mssql', 'n'}  # Supported databases
 ALLOWED_ARCH = {'medallion', 'data_mesh',
                 'data_vault', 'n'}  # Data architectures
 ALLOWED_ENVS = {'pip', 'conda'}  # Supported environment managers
+DEFAULT_MEDALLION_LAYERS = ('bronze', 'silver', 'gold')  # Default layers
+
+# CSV Schema Constants (lowercase, matched against stripped headers)
+REQUIRED_CSV_COLUMN_ORDER = (
+    'table name', 'field name', 'datatype', 'length',
+    'decimal places', 'key', 'enforce', 'partition column'
+)  # Display order for error messages
+REQUIRED_CSV_COLUMNS = frozenset(REQUIRED_CSV_COLUMN_ORDER)
+FLAG_VALUES = frozenset({'X', 'x'})  # Marks Key/Enforce/Partition columns
+
+# Project Layout Constants
+PROJECT_SUBDIRS = ('sql', 'src', 'docs', 'scripts')  # Always created
 
 # Database Configuration Constants
 DB_CONFIG = {
@@ -65,8 +88,10 @@ DB_CONFIG = {
             'drop': "IF EXISTS (SELECT * FROM sys.schemas WHERE name = '{schema}') "
                     "DROP SCHEMA {schema};"
         },
+        'drop_table': "IF OBJECT_ID('{table}', 'U') IS NOT NULL DROP TABLE {table};",
         'max_identifier': 128,
-        'param_style': 'named'
+        'param_style': 'named',
+        'quote': '[{}]'
     },
     'mysql': {
         'surrogate_key': "{quoted} INT AUTO_INCREMENT NOT NULL",
@@ -80,8 +105,10 @@ DB_CONFIG = {
             'create': "CREATE SCHEMA IF NOT EXISTS {schema};",
             'drop': "DROP SCHEMA IF EXISTS {schema};"
         },
+        'drop_table': "DROP TABLE IF EXISTS {table};",
         'max_identifier': 64,
-        'param_style': 'format'
+        'param_style': 'format',
+        'quote': '`{}`'
     },
     'postgresql': {
         'surrogate_key': "{quoted} SERIAL NOT NULL",
@@ -94,20 +121,186 @@ DB_CONFIG = {
             'create': "CREATE SCHEMA IF NOT EXISTS {schema};",
             'drop': "DROP SCHEMA IF EXISTS {schema} CASCADE;"
         },
+        'drop_table': "DROP TABLE IF EXISTS {table};",
         'max_identifier': 63,
-        'param_style': 'numbered'
+        'param_style': 'numbered',
+        'quote': '"{}"'
     }
 }
 
+# Parameterized types -> (requires length, requires decimals)
 PARAMETERIZED_TYPES = {
-    'nvarchar': ['length'],
-    'varchar': ['length'],
-    'char': ['length'],
-    'decimal': ['length', 'decimals'],
-    'numeric': ['length', 'decimals']
+    'nvarchar': (True, False),
+    'varchar': (True, False),
+    'char': (True, False),
+    'decimal': (True, True),
+    'numeric': (True, True)
+}
+
+# Generated File Templates
+GITIGNORE_TEMPLATE = """# Security
+.env
+secrets/
+
+# Python
+__pycache__/
+*.pyc
+*.pyo
+*.pyd
+venv/
+
+# Database
+*.db
+*.dump
+*.bak
+"""
+
+DOCKERFILE_TEMPLATE = """# WARNING: Change default credentials in production!
+FROM python:3.9-slim
+WORKDIR /app
+COPY requirements.txt .
+RUN pip install --no-cache-dir -r requirements.txt
+COPY . .
+CMD ["python", "src/main.py"]
+"""
+
+DOCKERIGNORE_TEMPLATE = """# Security
+.env
+secrets/
+*.key
+*.pem
+*.crt
+
+# Python
+__pycache__/
+*.pyc
+*.pyo
+*.pyd
+venv/
+
+# Development
+.idea/
+.vscode/
+.DS_Store
+
+# Database
+*.db
+*.dump
+*.bak
+"""
+
+COMPOSE_HEADER_TEMPLATE = """# WARNING: Change default credentials in production!
+version: '3.8'
+
+services:
+  app:
+    build: .
+    ports:
+      - "5000:5000"
+"""
+
+# docker-compose database services, substituted with $db_name
+DB_SERVICE_TEMPLATES = {
+    'mssql': string.Template("""
+  db:
+    image: mcr.microsoft.com/mssql/server:2019-latest
+    environment:
+      SA_PASSWORD: YourStrong!Passw0rd  # CHANGE IN PRODUCTION
+      ACCEPT_EULA: Y
+    ports:
+      - "1433:1433"
+    volumes:
+      - mssql_data:/var/opt/mssql
+"""),
+    'mysql': string.Template("""
+  db:
+    image: mysql:8
+    environment:
+      MYSQL_ROOT_PASSWORD: root  # CHANGE IN PRODUCTION
+      MYSQL_DATABASE: $db_name
+    ports:
+      - "3306:3306"
+    volumes:
+      - mysql_data:/var/lib/mysql
+"""),
+    'postgresql': string.Template("""
+  db:
+    image: postgres:13
+    environment:
+      POSTGRES_DB: $db_name
+      POSTGRES_PASSWORD: postgres  # CHANGE IN PRODUCTION
+    ports:
+      - "5432:5432"
+    volumes:
+      - postgres_data:/var/lib/postgresql/data
+""")
+}
+
+# OS-specific environment setup scripts: (file name, mode)
+SETUP_SCRIPT_FILES = {
+    'mac': ("setup_mac.sh", 0o755),
+    'win': ("setup_win.bat", 0o644)
+}
+
+# Setup script bodies per OS and environment manager, substituted with
+# $env_name (raw strings keep Windows path separators literal)
+SETUP_SCRIPT_TEMPLATES = {
+    'mac': {
+        'pip': string.Template("""#!/bin/bash
+python -m venv $env_name
+source $env_name/bin/activate
+pip install --upgrade pip
+[ -f requirements.txt ] && pip install -r requirements.txt
+echo "Activate with: source $env_name/bin/activate"
+"""),
+        'conda': string.Template("""#!/bin/bash
+eval "$$(conda shell.bash hook)"
+conda create -y -n $env_name python
+conda activate $env_name
+[ -f requirements.txt ] && pip install -r requirements.txt
+echo "Activate with: conda activate $env_name"
+""")
+    },
+    'win': {
+        'pip': string.Template(r"""@echo off
+python -m venv $env_name
+call $env_name\Scripts\activate.bat
+python -m pip install --upgrade pip
+if exist requirements.txt pip install -r requirements.txt
+echo Activate with: $env_name\Scripts\activate.bat
+pause
+"""),
+        'conda': string.Template(r"""@echo off
+call conda create -y -n $env_name python
+call conda activate $env_name
+if exist requirements.txt pip install -r requirements.txt
+echo Activate with: conda activate $env_name
+pause
+""")
+    }
+}
+
+DB_VOLUME_NAMES = {
+    'mssql': 'mssql_data',
+    'mysql': 'mysql_data',
+    'postgresql': 'postgres_data'
 }
 
 
+class Column(NamedTuple):
+    """
+    Processed column definition from the schema CSV
+
+    Attributes:
+        field (str): Sanitized column name
+        type (str): SQL type including any length/decimal parameters
+        enforce (bool): Whether the column is NOT NULL
+    """
+    field: str
+    type: str
+    enforce: bool
+
+
 class ProjectConfig:
     """
     Configuration container for project settings
@@ -132,7 +325,7 @@ class ProjectConfig:
 
     def __init__(self):
         self.project_name: str = ""
-        self.base_location: Path = Path.home() / "projects"
+        self.base_location: Path = Path()  # Will be set during configuration
         self.project_root: Path = Path()  # Will be set during configuration
         self.database: Optional[str] = None
         self.database_name: Optional[str] = None
@@ -158,14 +351,30 @@ def validate_safe_name(name: str) -> Tuple[bool, str]:
     Returns:
         Tuple[bool, str]: (True, "") if valid, (False, error message) otherwise
     """
-    if not SAFE_NAME_PATTERN.match(name):
-        return False, ("Invalid characters detected (only letters, numbers, "
-                       "hyphens and underscores allowed)")
     if len(name) > 128:
         return False, "Name exceeds maximum length (128 characters)"
+    # Plain set check for ASCII names; the regex only handles Unicode input
+    if SAFE_NAME_CHARS.issuperset(name):
+        valid = bool(name)
+    else:
+        valid = max(name) > '\x7f' and bool(SAFE_NAME_PATTERN.match(name))
+    if not valid:
+        return False, ("Invalid characters detected (only letters, numbers, "
+                       "hyphens and underscores allowed)")
     return True, ""
 
 
+@functools.lru_cache(maxsize=None)
+def resolved_home() -> Path:
+    """
+    Resolve the user's home directory once per run
+
+    Returns:
+        Path: Fully resolved home directory
+    """
+    return Path.home().resolve()
+
+
 def secure_path(input_path: Path) -> Path:
     """
     Validate and resolve paths securely
@@ -182,7 +391,7 @@ def secure_path(input_path: Path) -> Path:
         ValueError: On path traversal attempts
     """
     try:
-        home = Path.home().resolve()
+        home = resolved_home()
         expanded = input_path.expanduser().resolve()
 
         if home not in expanded.parents and expanded != home:
@@ -193,15 +402,85 @@ def secure_path(input_path: Path) -> Path:
         raise ValueError(f"Invalid path: {str(e)}") from e
 
 
+def validate_input_file(input_path: Path) -> Path:
+    """
+    Validate an input file path with security checks
+
+    Args:
+        input_path (Path): Path to validate
+
+    Returns:
+        Path: Resolved and validated file path
+
+    Raises:
+        ValueError: On path traversal, missing, non-regular or oversized files
+    """
+    validated_path = secure_path(input_path)
+    # One stat() covers existence, file type and size checks
+    try:
+        file_stat = validated_path.stat()
+    except OSError:
+        # Any stat failure (e.g. NotADirectoryError) means no usable file
+        raise ValueError("File not found")
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise ValueError("Not a regular file")
+    if file_stat.st_size > MAX_FILE_SIZE:
+        raise ValueError("File exceeds 10MB limit")
+    return validated_path
+
+
+class IdentifierCharTable(dict):
+    """
+    Lazily populated str.translate table that deletes unsafe characters
+
+    Keeps exactly the characters matched by ``[\\w/.-]`` (Unicode word
+    characters plus / . -) and maps everything else to None. Entries are
+    computed on first use, so the table only grows with the characters
+    actually seen in the input.
+    """
+
+    def __missing__(self, ordinal: int) -> Optional[int]:
+        char = chr(ordinal)
+        value = ordinal if char.isalnum() or char in '_/.-' else None
+        self[ordinal] = value
+        return value
+
+
+IDENTIFIER_DELETE_TABLE = IdentifierCharTable()
+
+
+def write_file(path: Path, content: str, mode: int = 0o644) -> None:
+    """
+    Write a text file with the given permissions in a single open
+
+    Args:
+        path (Path): Destination file
+        content (str): File content, written as UTF-8
+        mode (int): Permission bits applied to the file
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, mode)
+    # fdopen owns the descriptor from here, so it is closed on any error
+    with os.fdopen(fd, 'wb') as f:
+        # Apply the mode explicitly so it is not narrowed by the umask
+        if hasattr(os, 'fchmod'):
+            os.fchmod(f.fileno(), mode)
+        f.write(content.encode('utf-8'))
+
+
 # def sanitize_identifier(identifier: str, db_type: str) -> str:
 #     max_length = DB_CONFIG.get(db_type, {}).get('max_identifier', 64)
 #     clean = re.sub(r'[^\w]', '', identifier.strip('"`[]'))
 #     return clean[:max_length]
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_identifier(identifier: str, db_type: str) -> str:
     """
     Sanitize identifiers while preserving allowed special characters
 
+    Results are memoized since the same table, field and layer names are
+    sanitized repeatedly while processing CSV rows and generating DDL.
+
     Args:
         identifier: Original identifier from input
         db_type: Database type for length constraints
@@ -210,11 +489,11 @@ def sanitize_identifier(identifier: str, db_type: str) -> str:
         Sanitized identifier safe for database use
     """
     # Remove surrounding quotes/brackets and whitespace
-    stripped = identifier.strip('"`[] \t\n\r')
+    stripped = identifier.strip(IDENTIFIER_STRIP_CHARS)
 
     # Allow specific safe characters: letters, numbers, _, /, ., -
     # Remove any other special characters
-    clean = re.sub(r'[^\w/.-]', '', stripped)
+    clean = stripped.translate(IDENTIFIER_DELETE_TABLE)
 
     # Truncate to database's max identifier length
     max_length = DB_CONFIG.get(db_type, {}).get('max_identifier', 64)
@@ -224,13 +503,15 @@ class SecureInputHandler:
     """Secure input handling with validation"""
 
     @staticmethod
-    def get_input(prompt: str, validator: callable = None) -> str:
+    def get_input(prompt: str, validator: callable = None,
+                  default: Optional[str] = None) -> str:
         """
         Get validated user input
 
         Args:
             prompt (str): Display prompt
             validator (callable): Validation function
+            default (str|None): Value returned on empty input, if given
 
         Returns:
             str: Validated input
@@ -238,6 +519,8 @@ class SecureInputHandler:
         while True:
             value = input(prompt).strip()
             if not value:
+                if default is not None:
+                    return default
                 continue
             if validator:
                 valid, msg = validator(value)
@@ -260,16 +543,8 @@ class SecureInputHandler:
         """
         while True:
             path_str = SecureInputHandler.get_input(prompt)
-            path = Path(path_str)
             try:
-                validated_path = secure_path(path)
-                if not validated_path.exists():
-                    print("File not found")
-                    continue
-                if validated_path.stat().st_size > MAX_FILE_SIZE:
-                    print("File exceeds 10MB limit")
-                    continue
-                return validated_path
+                return validate_input_file(Path(path_str))
             except ValueError as e:
                 print(f"Path error: {str(e)}")
 
@@ -277,59 +552,40 @@ class SecureInputHandler:
 class CSVProcessor:
     """Secure CSV processing with schema validation"""
 
-    @staticmethod
-    def validate_structure(file_path: Path) -> None:
-        """
-        Validate CSV file structure
-
-        Args:
-            file_path (Path): Path to CSV file
-
-        Raises:
-            ValueError: On missing required columns
-        """
-        required_columns = {'table name', 'field name', 'datatype', 'length', 'decimal places'}
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            if not reader.fieldnames:
-                raise ValueError("Empty CSV file")
-
-            columns = {col.strip().lower() for col in reader.fieldnames}
-            missing = required_columns - columns
-            if missing:
-                raise ValueError(f"Missing columns: {', '.join(missing)}")
-
     @staticmethod
     def read_mapping(file_path: Path) -> Dict[str, str]:
         """
         Read and validate SQL type mapping file
 
+        Mapped types are normalized to their base type (any parenthesized
+        parameters are dropped) so callers can use them directly.
+
         Args:
             file_path (Path): Path to mapping file
 
         Returns:
-            Dict[str, str]: Type mapping dictionary
+            Dict[str, str]: Mapping of lowercase source type to base SQL type
 
         Raises:
             ValueError: On invalid file format
         """
-        mapping = {}
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
+        with open(file_path, 'r', encoding='utf-8-sig',
+                  buffering=CSV_READ_BUFFER) as f:
             reader = csv.reader(f)
             headers = next(reader, None)
 
             if not headers or len(headers) < 2:
                 raise ValueError("Invalid mapping file format")
 
-            for row in reader:
-                if len(row) < 2:
-                    continue
-
-                source = sanitize_identifier(row[0].strip().lower(), 'generic')
-                target = sanitize_identifier(row[1].strip(), 'generic')
-
-                if source and target:
-                    mapping[source] = target
+            # Drop parameters before sanitizing the target, which would
+            # otherwise fold them into the type name; preserve mapped case
+            pairs = (
+                (sanitize_identifier(row[0].strip().lower(), 'generic'),
+                 sanitize_identifier(row[1].split('(', 1)[0].strip(), 'generic'))
+                for row in reader if len(row) >= 2
+            )
+            mapping = {source: target for source, target in pairs
+                       if source and target}
 
         if not mapping:
             raise ValueError("No valid mappings found in file")
@@ -337,100 +593,140 @@ class CSVProcessor:
 
     @staticmethod
     def process_tables(file_path: Path, type_map: Dict[str, str]) -> Dict:
-      """
-      Process CSV data into table definitions with case preservation
-
-      Args:
-          file_path (Path): Path to CSV file
-          type_map (Dict): SQL type mapping
-
-      Returns:
-          Dict: Processed table definitions
-
-      Raises:
-          ValueError: On missing columns or invalid data
-      """
-      tables = {}
-      with open(file_path, 'r', encoding='utf-8-sig') as f:
-          reader = csv.DictReader(f)
-          for row in reader:
-              try:
-                  # Preserve original table name case
-                  table_name = sanitize_identifier(
-                      row['Table Name'].strip(),  # Removed .lower()
-                      'generic'
-                  )
-
-                  # Preserve original field name case
-                  field_name = sanitize_identifier(
-                      row['Field Name'].strip(),
-                      'generic'
-                  )
-
-                  # Case-insensitive type lookup with case preservation
-                  dtype_input = row['Datatype'].strip()
-                  dtype_lookup = dtype_input.lower()
-                  mapped_type = type_map.get(dtype_lookup, '')
-                  base_type = mapped_type.split('(')[0].strip()  # Preserve mapped case
-
-                  if not base_type:
-                      raise ValueError(f"Undefined type: {dtype_input}")
-
-                  length = row['Length'].strip()
-                  decimals = row['Decimal Places'].strip()
-                  is_key = row['Key'].strip().upper() == 'X'
-                  is_partition = row['Partition Column'].strip().upper() == 'X'
-
-                  if not table_name:
-                      continue
-
-                  if table_name not in tables:
-                      tables[table_name] = {
-                          'columns': [],
-                          'keys': [],
-                          'partition': None,
-                          'partition_type': None
-                      }
-
-                  # Case-insensitive check for parameterized types
-                  normalized_base = base_type.lower()
-                  if normalized_base in PARAMETERIZED_TYPES:
-                      required_params = PARAMETERIZED_TYPES[normalized_base]
-                      params = []
-
-                      # Validate required parameters
-                      if 'length' in required_params:
-                          if not length:
-                              raise ValueError(f"Missing length for {field_name}")
-                          params.append(length)
-
-                      if 'decimals' in required_params:
-                          if not decimals:
-                              raise ValueError(f"Missing decimals for {field_name}")
-                          params.append(decimals)
-
-                      sql_type = f"{base_type}({','.join(params)})"
-                  else:
-                      sql_type = base_type
-
-                  tables[table_name]['columns'].append({
-                      'field': field_name,
-                      'type': sql_type,
-                      'enforce': row['Enforce'].strip().upper() == 'X'
-                  })
-
-                  if is_key:
-                      tables[table_name]['keys'].append(field_name)
-                  if is_partition:
-                      if tables[table_name]['partition']:
-                          raise ValueError(f"Multiple partitions in {table_name}")
-                      tables[table_name]['partition'] = field_name
-                      tables[table_name]['partition_type'] = base_type
-
-              except KeyError as e:
-                  raise ValueError(f"Missing column in CSV: {e}")
-
-      return tables
+        """
+        Validate CSV structure and process data into table definitions
+        with case preservation in a single pass
+
+        Args:
+            file_path (Path): Path to CSV file
+            type_map (Dict): SQL base type mapping from read_mapping
+
+        Returns:
+            Dict: Processed table definitions
+
+        Raises:
+            ValueError: On missing columns or invalid data
+        """
+        tables = {}
+        with open(file_path, 'r', encoding='utf-8-sig',
+                  buffering=CSV_READ_BUFFER) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                raise ValueError("Empty CSV file")
+
+            idx = {name.strip().lower(): i for i, name in enumerate(header)}
+            missing = REQUIRED_CSV_COLUMNS - idx.keys()
+            if missing:
+                raise ValueError("Missing columns: " + ", ".join(
+                    col for col in REQUIRED_CSV_COLUMN_ORDER if col in missing))
+
+            # Resolve column positions once instead of per row
+            t_idx = idx['table name']
+            f_idx = idx['field name']
+            d_idx = idx['datatype']
+            l_idx = idx['length']
+            dp_idx = idx['decimal places']
+            k_idx = idx['key']
+            e_idx = idx['enforce']
+            p_idx = idx['partition column']
+            max_idx = max(idx[col] for col in REQUIRED_CSV_COLUMNS)
+
+            # Local bindings avoid global/attribute lookups in the row loop
+            get_base_type = type_map.get
+            param_types = PARAMETERIZED_TYPES
+
+            # Datatype -> (base type, needs length, needs decimals), resolved
+            # once per distinct datatype value
+            type_cache = {}
+
+            # Rows for a table are usually contiguous, so only re-resolve the
+            # table entry when the name changes
+            last_table_name = None
+            table = None
+
+            for row in reader:
+                if not row:
+                    continue
+                # Short rows are the only way a column can be missing here
+                if len(row) <= max_idx:
+                    raise ValueError(
+                        f"Missing column in CSV row {reader.line_num}")
+
+                # Preserve original table name case
+                table_name = sanitize_identifier(
+                    row[t_idx].strip(),  # Removed .lower()
+                    'generic'
+                )
+
+                # Preserve original field name case
+                field_name = sanitize_identifier(
+                    row[f_idx].strip(),
+                    'generic'
+                )
+
+                # Case-insensitive type lookup with case preservation
+                dtype_input = row[d_idx].strip()
+                resolved = type_cache.get(dtype_input)
+                if resolved is None:
+                    base_type = get_base_type(dtype_input.lower())
+                    if not base_type:
+                        raise ValueError(f"Undefined type: {dtype_input}")
+                    # Case-insensitive check for parameterized types
+                    resolved = type_cache[dtype_input] = (
+                        base_type,
+                        *param_types.get(base_type.lower(), (False, False)))
+                base_type, has_length, has_decimals = resolved
+
+                length = row[l_idx].strip()
+                decimals = row[dp_idx].strip()
+                is_key = row[k_idx].strip() in FLAG_VALUES
+                is_partition = row[p_idx].strip() in FLAG_VALUES
+
+                if not table_name:
+                    continue
+
+                if table_name != last_table_name:
+                    table = tables.get(table_name)
+                    if table is None:
+                        table = tables[table_name] = {
+                            'columns': [],
+                            'keys': [],
+                            'partition': None,
+                            'partition_type': None
+                        }
+                    last_table_name = table_name
+
+                # Validate required parameters
+                if has_length and not length:
+                    raise ValueError(f"Missing length for {field_name}")
+                if has_decimals and not decimals:
+                    raise ValueError(f"Missing decimals for {field_name}")
+
+                # Every decimal-parameterized type also takes a length
+                if has_decimals:
+                    sql_type = f"{base_type}({length},{decimals})"
+                elif has_length:
+                    sql_type = f"{base_type}({length})"
+                else:
+                    sql_type = base_type
+
+                # Compact tuple record keeps per-column overhead low
+                table['columns'].append(Column(
+                    field_name,
+                    sql_type,
+                    row[e_idx].strip() in FLAG_VALUES
+                ))
+
+                if is_key:
+                    table['keys'].append(field_name)
+                if is_partition:
+                    if table['partition']:
+                        raise ValueError(f"Multiple partitions in {table_name}")
+                    table['partition'] = field_name
+                    table['partition_type'] = base_type
+
+        return tables
 
 
 class SQLGenerator:
@@ -446,10 +742,29 @@ class SQLGenerator:
         self.config = config
         self._validate_config()
 
-    def _escape_string(self, value: str) -> str:
+        # The target database is fixed for the generator's lifetime, so
+        # resolve its templates once
+        self._db_cfg = DB_CONFIG.get(self.config.database, {})
+        self._quote_fmt = self._db_cfg.get('quote', '{}')
+        self._create_db_tmpls = self._db_cfg.get('create_db', [])
+        self._schema_drop_tmpl = self._db_cfg.get('schema', {}).get('drop')
+        self._schema_create_tmpl = self._db_cfg.get('schema', {}).get('create')
+        self._table_drop_tmpl = self._db_cfg.get('drop_table')
+        self._surrogate_tmpl = self._db_cfg.get('surrogate_key')
+        self._ingested_at = self._db_cfg.get('ingested_at')
+        # Batch terminator is fixed too: GO batches for MSSQL, ';' otherwise
+        self._terminator = "\nGO" if self.config.mssql_go else ";"
+        # Unbounded: the domain is limited to the CSV's distinct identifiers
+        self._quote = functools.lru_cache(maxsize=None)(self._quote_impl)
+        self._escape_string = functools.lru_cache(maxsize=256)(
+            self._escape_string_impl)
+        self._escaped_source = self._escape_string(
+            self.config.source_system or '')
+
+    def _escape_string_impl(self, value: str) -> str:
         """Properly escape string literals for different databases"""
         # First sanitize the input
-        clean_value = re.sub(r"[^\w/.-]", "", value.strip())
+        clean_value = value.strip().translate(IDENTIFIER_DELETE_TABLE)
 
         # Then escape single quotes
         escaped = clean_value.replace("'", "''")
@@ -466,13 +781,9 @@ class SQLGenerator:
         if self.config.database and self.config.database not in DB_CONFIG:
             raise ValueError("Unsupported database type")
 
-    def _quote(self, identifier: str) -> str:
-        clean = sanitize_identifier(identifier, self.config.database)
-        return {
-            'mssql': f'[{clean}]',
-            'mysql': f'`{clean}`',
-            'postgresql': f'"{clean}"'
-        }.get(self.config.database, clean)
+    def _quote_impl(self, identifier: str) -> str:
+        return self._quote_fmt.format(
+            sanitize_identifier(identifier, self.config.database))
 
     def generate_ddl(self, tables: Dict) -> Dict[str, str]:
         """
@@ -484,95 +795,182 @@ class SQLGenerator:
         Returns:
             Dict[str, str]: Layer-specific SQL files
         """
+        return dict(self.iter_ddl(tables))
+
+    def iter_ddl(self, tables: Dict) -> Iterator[Tuple[str, str]]:
+        """
+        Generate database DDL one layer file at a time
+
+        Only a single layer's SQL text is held in memory at once, so callers
+        can write each file as soon as it is produced.
+
+        Args:
+            tables (Dict): Table definitions
+
+        Yields:
+            Tuple[str, str]: SQL file name and its content
+        """
         if not self.config.database:
-            return {}
+            return
 
-        ddl = {}
-        for layer in self.config.medallion_layers:
-            commands = []
-            commands.extend(self._database_commands())
-            commands.extend(self._schema_commands(layer))
-            commands.extend(self._table_commands(layer, tables))
-            ddl[f"{layer}.sql"] = self._format_commands(commands)
+        # Database commands and table bodies do not depend on the layer,
+        # so build them once and only prefix the schema per layer
+        db_commands = self._database_commands()
+        table_bodies = [
+            self._build_table_body(table, data)
+            for table, data in tables.items()
+        ]
 
-        return ddl
+        for layer in self.config.medallion_layers:
+            quoted_layer = self._quote(layer)
+            commands = list(db_commands)
+            commands.extend(self._schema_commands(quoted_layer))
+            commands.extend(self._table_commands(quoted_layer, table_bodies))
+            yield f"{layer}.sql", self._format_commands(commands)
 
     def _database_commands(self) -> List[str]:
         quoted_db = self._quote(self.config.database_name)
-        return [
-            cmd.format(db=quoted_db)
-            for cmd in DB_CONFIG[self.config.database]['create_db']
-        ]
+        return [cmd.format(db=quoted_db) for cmd in self._create_db_tmpls]
 
-    def _schema_commands(self, layer: str) -> List[str]:
-        quoted_layer = self._quote(layer)
+    def _schema_commands(self, quoted_layer: str) -> List[str]:
         return [
-            DB_CONFIG[self.config.database]['schema']['drop'].format(
-                schema=quoted_layer
-            ),
-            DB_CONFIG[self.config.database]['schema']['create'].format(
-                schema=quoted_layer
-            )
+            self._schema_drop_tmpl.format(schema=quoted_layer),
+            self._schema_create_tmpl.format(schema=quoted_layer)
         ]
 
-    def _table_commands(self, layer: str, tables: Dict) -> List[str]:
-        commands = []
-        for table, data in tables.items():
-            quoted_table = self._quote(table)
-            full_name = f"{self._quote(layer)}.{quoted_table}"
+    def _column_definitions(self, table: str, data: Dict) -> List[str]:
+        """
+        Build the layer-independent column definitions for a table
 
-            columns = [
-                DB_CONFIG[self.config.database]['surrogate_key'].format(
-                    quoted=self._quote(f"{table}_id")
-                )
-            ]
-
-            for col in data['columns']:
-                quoted_col = self._quote(col['field'])
-                col_def = f"{quoted_col} {col['type']}"
-                if col['enforce']:
-                    col_def += " NOT NULL"
-                columns.append(col_def)
-
-            columns.extend([
-                "DWH_RECORD_ID VARCHAR(255) NOT NULL",
-                "DWH_JOB_RECORD_ID VARCHAR(255) NOT NULL",
-                f"DWH_SOURCE_SYSTEM VARCHAR(255) DEFAULT {self._escape_string(self.config.source_system)} NOT NULL",
-                f"DWH_SOURCE_TABLE VARCHAR(255) DEFAULT {self._escape_string(table)} NOT NULL",
-                DB_CONFIG[self.config.database]['ingested_at']
-            ])
+        Args:
+            table (str): Table name
+            data (Dict): Table definition from CSVProcessor.process_tables
 
-            if data['keys']:
-                quoted_keys = [self._quote(k) for k in data['keys']]
-                columns.append(f"PRIMARY KEY ({', '.join(quoted_keys)})")
+        Returns:
+            List[str]: Column and constraint definitions
+        """
+        quote = self._quote
+        columns = [self._surrogate_tmpl.format(quoted=quote(f"{table}_id"))]
+        columns.extend(
+            f"{quote(col.field)} {col.type}{' NOT NULL' if col.enforce else ''}"
+            for col in data['columns']
+        )
 
-            drop_sql = (
-                f"IF OBJECT_ID('{full_name}', 'U') IS NOT NULL DROP TABLE {full_name};"
-                if self.config.database == 'mssql' else
-                f"DROP TABLE IF EXISTS {full_name};"
-            )
-            create_sql = (
-                f"CREATE TABLE {full_name} (\n    "
-                + ",\n    ".join(columns)
-                + "\n)"
-            )
+        columns.extend([
+            "DWH_RECORD_ID VARCHAR(255) NOT NULL",
+            "DWH_JOB_RECORD_ID VARCHAR(255) NOT NULL",
+            f"DWH_SOURCE_SYSTEM VARCHAR(255) DEFAULT {self._escaped_source} NOT NULL",
+            f"DWH_SOURCE_TABLE VARCHAR(255) DEFAULT {self._escape_string(table)} NOT NULL",
+            self._ingested_at
+        ])
+
+        if data['keys']:
+            quoted_keys = [quote(k) for k in data['keys']]
+            columns.append(f"PRIMARY KEY ({', '.join(quoted_keys)})")
+
+        return columns
+
+    def _build_table_body(self, table: str, data: Dict) -> Tuple[str, str]:
+        """
+        Render the layer-independent parts of a table's DDL
+
+        Args:
+            table (str): Table name
+            data (Dict): Table definition from CSVProcessor.process_tables
+
+        Returns:
+            Tuple[str, str]: Quoted table name and CREATE TABLE column body
+        """
+        columns = self._column_definitions(table, data)
+        body = " (\n    " + ",\n    ".join(columns) + "\n)"
+        return self._quote(table), body
 
-            commands.extend([drop_sql, create_sql])
+    def _table_commands(self, quoted_layer: str,
+                        table_bodies: List[Tuple[str, str]]) -> List[str]:
+        drop_tmpl = self._table_drop_tmpl
+
+        commands = []
+        for quoted_table, body in table_bodies:
+            full_name = f"{quoted_layer}.{quoted_table}"
+            commands.extend([
+                drop_tmpl.format(table=full_name),
+                f"CREATE TABLE {full_name}{body}"
+            ])
 
         return commands
 
     def _format_commands(self, commands: List[str]) -> str:
-        if self.config.mssql_go:
-            return "\nGO\n".join(commands) + "\nGO"
-        return ";\n".join(commands) + ";"
+        # Single join with the terminator as separator; no per-command rewrite
+        terminator = self._terminator
+        return f"{terminator}\n".join(commands) + terminator
 
 
 class ProjectBuilder:
     """Main project builder orchestrator"""
 
-    def __init__(self):
+    def __init__(self, options: Optional[Dict] = None,
+                 interactive: bool = True):
+        """
+        Initialize project builder
+
+        Args:
+            options (Dict|None): Pre-supplied settings (see load_options)
+            interactive (bool): Prompt for settings missing from options
+        """
         self.config = ProjectConfig()
         self.input = SecureInputHandler()
+        self.options = options or {}
+        self.interactive = interactive
+
+    def _resolve(self, key: str, prompt: str, validator: callable = None,
+                 default: Optional[str] = None) -> str:
+        """
+        Resolve a setting from the supplied options or by prompting
+
+        Args:
+            key (str): Option name
+            prompt (str): Display prompt used in interactive mode
+            validator (callable): Validation function
+            default (str|None): Value used on empty input or when
+                non-interactive and missing
+
+        Returns:
+            str: Validated value
+
+        Raises:
+            ValueError: On invalid values or missing required options
+        """
+        if key in self.options:
+            value = str(self.options[key]).strip()
+            if validator:
+                valid, msg = validator(value)
+                if not valid:
+                    raise ValueError(f"Invalid value for '{key}': {msg}")
+            return value
+        if self.interactive:
+            return self.input.get_input(prompt, validator, default=default)
+        if default is not None:
+            return default
+        raise ValueError(f"Missing required option: {key}")
+
+    def _resolve_flag(self, key: str, prompt: str) -> bool:
+        """Resolve a yes/no setting; defaults to False when non-interactive"""
+        if key in self.options:
+            value = self.options[key]
+            if isinstance(value, str):
+                return value.strip().lower() in {'y', 'yes', 'true', '1'}
+            return bool(value)
+        if self.interactive:
+            return self.input.get_input(prompt).lower() == 'y'
+        return False
+
+    def _resolve_file(self, key: str, prompt: str) -> Path:
+        """Resolve an input file path with the same checks as get_file"""
+        if key in self.options:
+            return validate_input_file(Path(str(self.options[key])))
+        if self.interactive:
+            return self.input.get_file(prompt)
+        raise ValueError(f"Missing required option: {key}")
 
     def setup(self):
         """Main entry point for project setup"""
@@ -586,16 +984,20 @@ class ProjectBuilder:
 
     def _get_basic_info(self):
         """Collect basic project information"""
-        self.config.project_name = self.input.get_input(
+        self.config.project_name = self._resolve(
+            'project_name',
             "Project name: ",
             lambda x: validate_safe_name(x)
         )
 
-        default_base = str(self.config.base_location)
-        base_loc_str = self.input.get_input(
+        # Only built here, when the prompt actually needs it
+        default_base = str(Path.home() / "projects")
+        base_loc_str = self._resolve(
+            'base_location',
             f"Base directory for projects [{default_base}]: ",
-            lambda x: (True, "")
-        ) or default_base
+            lambda x: (True, ""),
+            default=default_base
+        )
 
         try:
             self.config.base_location = secure_path(Path(base_loc_str))
@@ -608,15 +1010,15 @@ class ProjectBuilder:
 
     def _build_project_structure(self):
         """Create directory structure with security checks"""
-        try:
-            self.config.project_root.mkdir(parents=True, exist_ok=False)
-            (self.config.project_root / "sql").mkdir()
-            (self.config.project_root / "src").mkdir()
-            (self.config.project_root / "docs").mkdir()
-            (self.config.project_root / "scripts").mkdir()
+        root = self.config.project_root
+        subdirs = list(PROJECT_SUBDIRS)
+        if self.config.docker:
+            subdirs.append("docker")
 
-            if self.config.docker:
-                (self.config.project_root / "docker").mkdir()
+        try:
+            root.mkdir(parents=True, exist_ok=False)
+            for subdir in subdirs:
+                (root / subdir).mkdir()
 
         except FileExistsError:
             print(
@@ -625,176 +1027,87 @@ class ProjectBuilder:
 
     def _generate_project_files(self):
         """Generate all project files in appropriate locations"""
+        # Files are independent; write each in a worker thread while the
+        # next one (e.g. the next layer's SQL) is being generated
+        max_workers = 4
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for path, content, mode in self._iter_project_files():
+                pending.append(executor.submit(write_file, path, content, mode))
+                # Backpressure: wait for the oldest write before generating
+                # more, so only a few files' content is held at once
+                if len(pending) > max_workers:
+                    pending.popleft().result()
+            for future in pending:
+                future.result()
+
+    def _iter_project_files(self) -> Iterator[Tuple[Path, str, int]]:
+        """
+        Yield every generated project file
+
+        Yields:
+            Tuple[Path, str, int]: Destination path, content and file mode
+        """
         if self.config.database:
-            CSVProcessor.validate_structure(self.config.csv_path)
-            type_map = CSVProcessor.read_mapping(self.config.sql_mapping_path)
-            tables = CSVProcessor.process_tables(
-                self.config.csv_path, type_map)
+            yield from self._generate_sql_files()
 
-            generator = SQLGenerator(self.config)
-            ddl_files = generator.generate_ddl(tables)
+        if self.config.docker:
+            yield from self._generate_docker_files()
 
-            sql_dir = self.config.project_root / "sql"
-            for name, content in ddl_files.items():
-                path = sql_dir / name
-                path.write_text(content)
-                path.chmod(0o644)
+        yield from self._generate_environment_scripts()
 
-        if self.config.docker:
-            self._generate_docker_files()
+    def _generate_sql_files(self) -> Iterator[Tuple[Path, str, int]]:
+        """Generate layer SQL files in sql/ directory"""
+        type_map = CSVProcessor.read_mapping(self.config.sql_mapping_path)
+        tables = CSVProcessor.process_tables(self.config.csv_path, type_map)
 
-        self._generate_environment_scripts()
+        generator = SQLGenerator(self.config)
+        sql_dir = self.config.project_root / "sql"
+        for name, content in generator.iter_ddl(tables):
+            yield sql_dir / name, content, 0o644
 
     def _generate_compose_content(self) -> str:
         """Generate docker-compose.yml content based on project configuration"""
-        compose_content = """# WARNING: Change default credentials in production!
-version: '3.8'
-
-services:
-  app:
-    build: .
-    ports:
-      - "5000:5000"
-"""
+        parts = [COMPOSE_HEADER_TEMPLATE]
 
         if self.config.database:
-            db_service = self._generate_db_service()
-            compose_content += db_service
+            parts.append(self._generate_db_service())
 
-        compose_content += "\nvolumes:"
-        if self.config.database == 'mssql':
-            compose_content += "\n  mssql_data:"
-        elif self.config.database == 'mysql':
-            compose_content += "\n  mysql_data:"
-        elif self.config.database == 'postgresql':
-            compose_content += "\n  postgres_data:"
+        parts.append("\nvolumes:")
+        volume = DB_VOLUME_NAMES.get(self.config.database)
+        if volume:
+            parts.append(f"\n  {volume}:")
 
-        return compose_content
+        return "".join(parts)
 
     def _generate_db_service(self) -> str:
         """Generate database service configuration for docker-compose.yml"""
-        db = self.config.database
-        name = self.config.database_name
-
-        services = {
-            'mssql': f"""
-  db:
-    image: mcr.microsoft.com/mssql/server:2019-latest
-    environment:
-      SA_PASSWORD: YourStrong!Passw0rd  # CHANGE IN PRODUCTION
-      ACCEPT_EULA: Y
-    ports:
-      - "1433:1433"
-    volumes:
-      - mssql_data:/var/opt/mssql
-""",
-            'mysql': f"""
-  db:
-    image: mysql:8
-    environment:
-      MYSQL_ROOT_PASSWORD: root  # CHANGE IN PRODUCTION
-      MYSQL_DATABASE: {name}
-    ports:
-      - "3306:3306"
-    volumes:
-      - mysql_data:/var/lib/mysql
-""",
-            'postgresql': f"""
-  db:
-    image: postgres:13
-    environment:
-      POSTGRES_DB: {name}
-      POSTGRES_PASSWORD: postgres  # CHANGE IN PRODUCTION
-    ports:
-      - "5432:5432"
-    volumes:
-      - postgres_data:/var/lib/postgresql/data
-"""
-        }
-        return services.get(db, "")
+        template = DB_SERVICE_TEMPLATES.get(self.config.database)
+        if template is None:
+            return ""
+        return template.substitute(db_name=self.config.database_name)
 
-    def _generate_docker_files(self):
+    def _generate_docker_files(self) -> Iterator[Tuple[Path, str, int]]:
         """Generate Docker configuration files"""
         docker_dir = self.config.project_root / "docker"
         docker_dir.mkdir(exist_ok=True)
 
-        # Dockerfile
-        dockerfile_path = docker_dir / "Dockerfile"
-        dockerfile_path.write_text("""# WARNING: Change default credentials in production!
-FROM python:3.9-slim
-WORKDIR /app
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-COPY . .
-CMD ["python", "src/main.py"]
-""")
-        dockerfile_path.chmod(0o644)
-
-        # docker-compose.yml
-        compose_path = docker_dir / "docker-compose.yml"
-        compose_content = self._generate_compose_content()
-        compose_path.write_text(compose_content)
-        compose_path.chmod(0o644)
-
-        # .dockerignore
-        dockerignore_path = docker_dir / ".dockerignore"
-        dockerignore_content = """# Security
-.env
-secrets/
-*.key
-*.pem
-*.crt
+        yield docker_dir / "Dockerfile", DOCKERFILE_TEMPLATE, 0o644
+        yield (docker_dir / "docker-compose.yml",
+               self._generate_compose_content(), 0o644)
+        yield docker_dir / ".dockerignore", DOCKERIGNORE_TEMPLATE, 0o644
 
-# Python
-__pycache__/
-*.pyc
-*.pyo
-*.pyd
-venv/
-
-# Development
-.idea/
-.vscode/
-.DS_Store
-
-# Database
-*.db
-*.dump
-*.bak
-"""
-        dockerignore_path.write_text(dockerignore_content)
-        dockerignore_path.chmod(0o644)
-
-    def _generate_environment_scripts(self):
+    def _generate_environment_scripts(self) -> Iterator[Tuple[Path, str, int]]:
         """Generate setup scripts in scripts/ directory"""
         scripts_dir = self.config.project_root / "scripts"
         env_name = sanitize_identifier(
             f"{self.config.project_name}_env", 'generic')
 
         for os_type in self.config.os_scripts:
-            if os_type == 'mac':
-                script_path = scripts_dir / "setup_mac.sh"
-                content = f"""#!/bin/bash
-python -m venv {env_name}
-source {env_name}/bin/activate
-pip install --upgrade pip
-[ -f requirements.txt ] && pip install -r requirements.txt
-echo "Activate with: source {env_name}/bin/activate"
-"""
-                script_path.write_text(content)
-                script_path.chmod(0o755)
-
-            elif os_type == 'win':
-                script_path = scripts_dir / "setup_win.bat"
-                content = f"""@echo off
-python -m venv {env_name}
-call {env_name}\\Scripts\\activate.bat
-python -m pip install --upgrade pip
-if exist requirements.txt pip install -r requirements.txt
-echo Activate with: {env_name}\\Scripts\\activate.bat
-pause
-"""
-                script_path.write_text(content)
+            file_name, mode = SETUP_SCRIPT_FILES[os_type]
+            template = SETUP_SCRIPT_TEMPLATES[os_type][self.config.python_env]
+            yield (scripts_dir / file_name,
+                   template.substitute(env_name=env_name), mode)
 
     def _finalize_project(self):
         """Final steps including git initialization"""
@@ -803,9 +1116,13 @@ pause
 
         print(f"\nProject successfully created at: {self.config.project_root}")
         print("Directory structure:")
-        for path in self.config.project_root.glob('**/*'):
-            if path.is_dir():
-                print(f"  {path.relative_to(self.config.project_root)}/")
+        # os.walk reports directories straight from the directory listing,
+        # avoiding a Path object and stat() per entry
+        root = self.config.project_root
+        for dirpath, dirnames, _ in os.walk(root):
+            for name in dirnames:
+                rel = os.path.relpath(os.path.join(dirpath, name), root)
+                print(f"  {rel}/")
 
     def _init_git_repo(self):
         """Initialize git repository in project root"""
@@ -813,69 +1130,65 @@ pause
             ['git', 'init', '-q'],
             cwd=self.config.project_root,
             check=True,
-            shell=False
+            shell=False,
+            stdout=subprocess.DEVNULL
         )
         gitignore = self.config.project_root / ".gitignore"
-        gitignore.write_text("""# Security
-.env
-secrets/
-
-# Python
-__pycache__/
-*.pyc
-*.pyo
-*.pyd
-venv/
-
-# Database
-*.db
-*.dump
-*.bak
-""")
+        write_file(gitignore, GITIGNORE_TEMPLATE)
 
     def _get_database_config(self):
         """Collect and validate database configuration from user input"""
-        db_choice = self.input.get_input(
-            "Database (mysql/postgresql/mssql/n): ",
+        db_choice = self._resolve(
+            'database',
+            "Database (mysql/postgresql/mssql/n) [n]: ",
             # Now returns (bool, message)
-            lambda x: (x in ALLOWED_DB_TYPES, "Invalid choice")
+            lambda x: (x in ALLOWED_DB_TYPES, "Invalid choice"),
+            default='n'
         )
         if db_choice == 'n':
             return
 
         self.config.database = db_choice
-        self.config.database_name = self.input.get_input(
+        self.config.database_name = self._resolve(
+            'database_name',
             "Database name: ",
             validate_safe_name
         )
-        self.config.source_system = self.input.get_input(
+        self.config.source_system = self._resolve(
+            'source_system',
             "Source system name: ",
             validator=lambda x: validate_safe_name(x) if x else (True, "")
         )
-        self.config.csv_path = self.input.get_file("CSV mapping path: ")
-        self.config.sql_mapping_path = self.input.get_file(
-            "SQL type mapping: ")
+        self.config.csv_path = self._resolve_file(
+            'csv_path', "CSV mapping path: ")
+        self.config.sql_mapping_path = self._resolve_file(
+            'sql_mapping_path', "SQL type mapping: ")
         self.config.mssql_go = (db_choice == 'mssql')
 
     def _get_architecture(self):
         """Collect and validate architecture configuration"""
-        arch = self.input.get_input(
-            "Architecture (medallion/data_mesh/data_vault/n): ",
+        arch = self._resolve(
+            'architecture',
+            "Architecture (medallion/data_mesh/data_vault/n) [n]: ",
             # Corrected validation
-            lambda x: (x in ALLOWED_ARCH, "Invalid architecture")
+            lambda x: (x in ALLOWED_ARCH, "Invalid architecture"),
+            default='n'
         )
         if arch == 'n':
             return
 
         self.config.data_arch = arch
         if arch == 'medallion':
-            layers_input = self.input.get_input(
+            layers_input = self._resolve(
+                'medallion_layers',
                 "Medallion layers (space-separated) [bronze silver gold]: ",
-                lambda x: (x, "") if x else ('bronze silver gold', "")
+                lambda x: (x, "") if x else ('bronze silver gold', ""),
+                default=""
             )
-            layers = layers_input.split() if layers_input else [
-                'bronze', 'silver', 'gold']
-            self.config.medallion_layers = [l.strip() for l in layers]
+            # str.split() already strips whitespace around each layer
+            layers = layers_input.split()
+            self.config.medallion_layers = (
+                layers if layers else list(DEFAULT_MEDALLION_LAYERS))
 
             for layer in self.config.medallion_layers:
                 valid, msg = validate_safe_name(layer)
@@ -885,26 +1198,134 @@ venv/
 
     def _get_additional_config(self):
         """Collect additional configuration options"""
-        self.config.docker = self.input.get_input(
-            "Generate Docker files? (y/n): ").lower() == 'y'
-        self.config.python_env = self.input.get_input(
-            "Environment manager (pip/conda): ",
+        self.config.docker = self._resolve_flag(
+            'docker', "Generate Docker files? (y/n): ")
+        self.config.python_env = self._resolve(
+            'python_env',
+            "Environment manager (pip/conda) [pip]: ",
             # Fixed validation
-            lambda x: (x in ALLOWED_ENVS, "Invalid manager")
+            lambda x: (x in ALLOWED_ENVS, "Invalid manager"),
+            default='pip'
         )
-        self.config.git_init = self.input.get_input(
-            "Initialize Git? (y/n): ").lower() == 'y'
+        self.config.git_init = self._resolve_flag(
+            'git_init', "Initialize Git? (y/n): ")
 
-        if self.input.get_input("Generate macOS scripts? (y/n): ").lower() == 'y':
+        if self._resolve_flag('mac_scripts', "Generate macOS scripts? (y/n): "):
             self.config.os_scripts.add('mac')
-        if self.input.get_input("Generate Windows scripts? (y/n): ").lower() == 'y':
+        if self._resolve_flag('win_scripts', "Generate Windows scripts? (y/n): "):
             self.config.os_scripts.add('win')
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line options
+
+    Every setting defaults to None so unset flags can be told apart from
+    explicit values and left to the config file or interactive prompts.
+
+    Args:
+        argv (List[str]|None): Arguments to parse (defaults to sys.argv)
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Scaffold a data project with SQL, Docker and setup scripts")
+    parser.add_argument('--config', type=Path,
+                        help="JSON or YAML file with project settings")
+    parser.add_argument('--non-interactive', action='store_true',
+                        help="Fail on missing required settings instead of prompting "
+                             "(implied when stdin is not a terminal)")
+    parser.add_argument('--project-name', dest='project_name')
+    parser.add_argument('--base-location', dest='base_location')
+    parser.add_argument('--database', choices=sorted(ALLOWED_DB_TYPES))
+    parser.add_argument('--database-name', dest='database_name')
+    parser.add_argument('--source-system', dest='source_system')
+    parser.add_argument('--csv-path', dest='csv_path')
+    parser.add_argument('--sql-mapping-path', dest='sql_mapping_path')
+    parser.add_argument('--architecture', choices=sorted(ALLOWED_ARCH))
+    parser.add_argument('--medallion-layers', dest='medallion_layers',
+                        nargs='+')
+    parser.add_argument('--docker', dest='docker', action='store_true',
+                        default=None)
+    parser.add_argument('--no-docker', dest='docker', action='store_false',
+                        default=None)
+    parser.add_argument('--python-env', dest='python_env',
+                        choices=sorted(ALLOWED_ENVS))
+    parser.add_argument('--git-init', dest='git_init', action='store_true',
+                        default=None)
+    parser.add_argument('--no-git-init', dest='git_init', action='store_false',
+                        default=None)
+    parser.add_argument('--os-scripts', dest='os_scripts', nargs='*',
+                        choices=['mac', 'win'])
+    return parser.parse_args(argv)
+
+
+def load_config_file(file_path: Path) -> Dict:
+    """
+    Load project settings from a JSON or YAML file
+
+    Args:
+        file_path (Path): Path to config file (.json, .yml or .yaml)
+
+    Returns:
+        Dict: Settings keyed by option name
+
+    Raises:
+        ValueError: On invalid files or when PyYAML is needed but missing
+    """
+    validated_path = validate_input_file(file_path)
+    text = validated_path.read_text(encoding='utf-8')
+    if validated_path.suffix.lower() in {'.yml', '.yaml'}:
+        try:
+            import yaml
+        except ImportError as e:
+            raise ValueError("PyYAML is required for YAML config files") from e
+        data = yaml.safe_load(text) or {}
+    else:
+        data = json.loads(text)
+
+    if not isinstance(data, dict):
+        raise ValueError("Config file must contain a mapping of settings")
+    return {str(k).replace('-', '_'): v for k, v in data.items()}
+
+
+def load_options(args: argparse.Namespace) -> Dict:
+    """
+    Merge config file settings with command-line flags
+
+    Flags take precedence over the config file. List values are
+    normalized to the forms the interactive prompts produce.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+
+    Returns:
+        Dict: Settings keyed by option name
+    """
+    options = load_config_file(args.config) if args.config else {}
+    for key, value in vars(args).items():
+        if key not in {'config', 'non_interactive'} and value is not None:
+            options[key] = value
+
+    layers = options.get('medallion_layers')
+    if isinstance(layers, (list, tuple)):
+        options['medallion_layers'] = " ".join(str(l) for l in layers)
+
+    os_scripts = options.pop('os_scripts', None)
+    if os_scripts is not None:
+        for os_type in ('mac', 'win'):
+            options[f'{os_type}_scripts'] = os_type in os_scripts
+
+    return options
+
+
 if __name__ == "__main__":
     try:
         sys.tracebacklimit = 0
-        builder = ProjectBuilder()
+        args = parse_args()
+        interactive = not args.non_interactive and sys.stdin.isatty()
+        builder = ProjectBuilder(load_options(args), interactive=interactive)
         builder.setup()
     except Exception as e:
         print(f"Setup failed: {str(e)}")